@@ -0,0 +1,32 @@
+"""
+Build hook for the optional compiled build of errfriendly.
+
+All project metadata lives in pyproject.toml. Setting ERRFRIENDLY_COMPILE=1
+at build time compiles ``errfriendly.messages`` (the message rendering hot
+path) to a C extension with mypyc; otherwise the pure-Python package is
+built, and source installs always keep working.
+
+    ERRFRIENDLY_COMPILE=1 pip install --no-build-isolation .
+
+``errfriendly.handler`` is deliberately left interpreted: it is patched at
+runtime (tests replace ``handler.get_friendly_message``) and its hooks are
+closures assigned to ``sys.excepthook``, which compiled modules don't
+support as transparently.
+
+Requires mypy/mypyc 1.11 or newer at build time (``--no-build-isolation``
+means the build uses whatever mypy is installed).
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("ERRFRIENDLY_COMPILE") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--follow-imports=silent", "src/errfriendly/messages.py"]
+    )
+
+setup(ext_modules=ext_modules)
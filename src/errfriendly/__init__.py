@@ -11,10 +11,13 @@ from .handler import (
     install,
     uninstall,
     is_installed,
+    install_async,
+    uninstall_async,
     enable_ai,
     disable_ai,
     configure,
     get_config,
+    clear_message_cache,
 )
 from .audit import enable_audit, disable_audit
 from .warning_handler import enable_warnings, disable_warnings
@@ -37,6 +40,9 @@ __all__ = [
     "uninstall",
     "is_installed",
     "get_friendly_message",
+    "clear_message_cache",
+    "install_async",
+    "uninstall_async",
     # v3.0: AI functions
     "enable_ai",
     "disable_ai",
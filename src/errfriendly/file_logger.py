@@ -0,0 +1,80 @@
+"""
+file_logger.py - Background file logging for errfriendly.
+
+The exception hook only puts records on an in-memory queue; a
+``QueueListener`` thread owns the ``FileHandler`` and does the disk I/O.
+
+This module is imported lazily by ``install(log_file=...)`` so that a plain
+``import errfriendly`` doesn't pay for ``logging``, ``queue`` and
+``threading``.
+"""
+
+import time
+import queue
+import logging
+import logging.handlers
+from typing import Tuple
+
+LOGGER_NAME = "errfriendly"
+
+
+class _FastFormatter(logging.Formatter):
+    """
+    Formatter equivalent to ``"%(asctime)s - %(levelname)s\\n%(message)s"``.
+    
+    The date/time part is rendered with ``time.strftime`` at most once per
+    second and reused for records created within the same second.
+    """
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self._last_t = -1
+        self._last_s = ""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        t = int(record.created)
+        if t != self._last_t:
+            self._last_s = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+            self._last_t = t
+        return f"{self._last_s},{int(record.msecs):03d} - {record.levelname}\n{record.getMessage()}"
+
+
+def start_file_logging(log_file: str) -> Tuple[logging.Logger, logging.handlers.QueueListener]:
+    """
+    Attach a queue-backed file handler to the errfriendly logger.
+    
+    Args:
+        log_file: Path of the log file (opened lazily on the first record).
+    
+    Returns:
+        Tuple of (logger, started listener).
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.ERROR)
+    
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+    file_handler.setFormatter(_FastFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger, listener
+
+
+def stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a log listener, flushing queued records, and close its handlers."""
+    # stop() drains the queue before returning
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        handler.close()
+
+
+def close_logger() -> None:
+    """Close and detach all handlers of the errfriendly logger."""
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
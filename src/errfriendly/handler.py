@@ -8,12 +8,15 @@ the standard Python traceback.
 v3.0 adds AI-powered contextual explanations and exception chain analysis.
 """
 
+import os
 import sys
+import weakref
+import codecs
 import traceback
-import logging
-from typing import Type, Optional, Union, Dict, Any
+from functools import lru_cache
+from typing import Type, Optional, Union, Dict, Any, List, TYPE_CHECKING
 
-from .messages import get_friendly_message
+from .messages import get_friendly_message, _is_text_only, _use_colors
 from .warning_handler import enable_warnings, disable_warnings
 from .models import (
     Config, 
@@ -23,19 +26,49 @@ from .models import (
     ExplanationStyle,
 )
 
+if TYPE_CHECKING:
+    import logging
+    import logging.handlers
+
 # Lazy imports for optional AI features
 _context_collector = None
 _ai_explainer = None
 _chain_analyzer = None
 
-# Store the original excepthook so we can restore it later
-_original_excepthook: Optional[object] = None
-_show_original_traceback: bool = True
-_logger: Optional[logging.Logger] = None
+
+class _State:
+    """Install-time state of the exception hook, kept in one object."""
+    
+    __slots__ = (
+        "original_hook", "current_hook", "installed_cfg",
+        "log_listener", "log_finalizer", "stderr_probe", "__weakref__",
+    )
+    
+    def __init__(self) -> None:
+        # The original excepthook, so we can restore it later
+        self.original_hook: Optional[object] = None
+        # The specialized hook installed by install(); used by is_installed()
+        self.current_hook: Optional[object] = None
+        # (show_original_traceback, log_file) the current hook was built for
+        self.installed_cfg: Optional[tuple] = None
+        # Background listener that owns the log FileHandler (see install())
+        self.log_listener: Optional["logging.handlers.QueueListener"] = None
+        # Run-once closer for log_listener (see file_logger.stop_listener())
+        self.log_finalizer: Optional[weakref.finalize] = None
+        # (stream, live) from the last fstat-based check of sys.stderr, so
+        # the check only runs again once sys.stderr is replaced
+        self.stderr_probe: Optional[tuple] = None
+
+
+_STATE = _State()
 
 # v3.0 configuration
 _config: Config = Config()
 
+# Control-flow exceptions that go straight to the default hook: a friendly
+# explanation only delays shutdown (and clutters Ctrl-C output)
+_BYPASS_EXC = (KeyboardInterrupt, SystemExit, GeneratorExit)
+
 
 def _get_context_collector():
     """Lazy-load the context collector."""
@@ -64,72 +97,328 @@ def _get_chain_analyzer():
     return _chain_analyzer
 
 
-def _friendly_excepthook(
+@lru_cache(maxsize=256)
+def _get_friendly_message_cached(
+    exc_type: Type[BaseException],
+    error_message: str,
+    use_colors: bool
+) -> str:
+    """Render the static friendly message for a type/message pair, memoized.
+    
+    ``use_colors`` is only part of the cache key: the rendered text embeds
+    ANSI codes depending on whether stderr is a TTY.
+    """
+    return get_friendly_message(exc_type, error_message)
+
+
+def _message_key(exc_value: BaseException) -> str:
+    """Get the message text used as cache key, interned when short.
+    
+    Interning makes repeated identical messages the same object, so cache
+    lookups compare by identity instead of character by character.
+    """
+    error_message = str(exc_value)
+    return sys.intern(error_message) if len(error_message) < 256 else error_message
+
+
+def _get_friendly_message(
     exc_type: Type[BaseException],
     exc_value: BaseException,
     exc_traceback
-) -> None:
+) -> str:
+    """Get the static friendly message, reusing memoized output when possible."""
+    if _is_text_only(exc_type):
+        try:
+            error_message = _message_key(exc_value)
+        except Exception:
+            pass
+        else:
+            return _get_friendly_message_cached(exc_type, error_message, _use_colors())
+    return get_friendly_message(exc_type, exc_value, tb=exc_traceback)
+
+
+def clear_message_cache() -> None:
     """
-    Custom exception hook that shows both the original traceback
-    and a friendly explanation.
+    Clear the memoized friendly messages.
+    
+    Repeated exceptions with the same type and message reuse the previously
+    rendered explanation; call this if the message templates were changed
+    at runtime.
+    """
+    _get_friendly_message_cached.cache_clear()
+
+
+class _LazyTraceback:
+    """Log argument that formats the traceback only when rendered.
+    
+    If the hook already formatted the traceback for stderr, the same text
+    is passed in as ``tb_text`` and reused instead of walking the frames
+    a second time.
+    """
+    
+    __slots__ = ("exc_type", "exc_value", "exc_traceback", "message", "tb_text")
+    
+    def __init__(
+        self,
+        exc_type,
+        exc_value,
+        exc_traceback,
+        message: str,
+        tb_text: Optional[str] = None
+    ) -> None:
+        self.exc_type = exc_type
+        self.exc_value = exc_value
+        self.exc_traceback = exc_traceback
+        self.message = message
+        self.tb_text = tb_text
+    
+    def __str__(self) -> str:
+        if self.tb_text is None:
+            self.tb_text = "".join(traceback.format_exception(
+                self.exc_type, self.exc_value, self.exc_traceback
+            ))
+        return self.tb_text + "\n" + self.message
+
+
+def _build_friendly_output(
+    exc_type: Type[BaseException],
+    exc_value: BaseException,
+    exc_traceback
+) -> str:
+    """
+    Build the full friendly output for an exception: chain analysis and
+    AI explanation (when enabled) followed by the static message.
     
     Args:
         exc_type: The exception class.
         exc_value: The exception instance.
         exc_traceback: The traceback object.
     """
-    global _show_original_traceback, _logger, _config
+    output_parts = []
+    
+    # Check for exception chains first (v3.0)
+    if _config.show_chain_analysis and _has_exception_chain(exc_value):
+        chain_output = _generate_chain_analysis(exc_type, exc_value, exc_traceback)
+        if chain_output:
+            output_parts.append(chain_output)
+    
+    # Try AI explanation if enabled (v3.0)
+    if _config.ai_enabled:
+        ai_output = _generate_ai_explanation(exc_type, exc_value, exc_traceback)
+        if ai_output:
+            output_parts.append(ai_output)
+    
+    # Always include static friendly message as fallback/complement
+    friendly_message = _get_friendly_message(exc_type, exc_value, exc_traceback)
+    
+    # If we have AI/chain output, combine them appropriately
+    if output_parts:
+        full_output = "\n".join(output_parts)
+        # Add a separator before static message if AI provided output
+        full_output += "\n\n" + "=" * 70 + "\n"
+        full_output += "📝 Quick Reference (Static):\n"
+        full_output += friendly_message
+    else:
+        full_output = friendly_message
     
-    # Show the original traceback if configured to do so
-    if _show_original_traceback:
-        # Print the standard Python traceback
-        traceback.print_exception(exc_type, exc_value, exc_traceback)
+    return full_output
+
+
+@lru_cache(maxsize=64)
+def _encode_line(text: str) -> bytes:
+    """Encode a message plus newline for stderr, memoized.
     
-    # Wrap all message generation in try/except for robustness
+    Repeated exceptions produce the same (memoized) message object, so the
+    encoded payload is built once and reused.
+    """
+    return (text + "\n").encode("utf-8", "backslashreplace")
+
+
+def _raw_stderr_fd() -> Optional[int]:
+    """Get the stderr file descriptor if it is safe to write bytes to it directly.
+    
+    Only the interpreter's own UTF-8 stderr qualifies; a replaced
+    ``sys.stderr`` (pytest capture, redirect_stderr, ...) must go through
+    its ``write()``. Never on Windows, where a console stderr reports UTF-8
+    but needs ``WriteConsoleW`` (raw bytes come out as mojibake).
+    """
+    if sys.platform == "win32":
+        return None
+    stream = sys.stderr
+    if stream is None or stream is not sys.__stderr__:
+        return None
     try:
-        output_parts = []
-        
-        # Check for exception chains first (v3.0)
-        if _config.show_chain_analysis and _has_exception_chain(exc_value):
-            chain_output = _generate_chain_analysis(exc_type, exc_value, exc_traceback)
-            if chain_output:
-                output_parts.append(chain_output)
-        
-        # Try AI explanation if enabled (v3.0)
-        if _config.ai_enabled:
-            ai_output = _generate_ai_explanation(exc_type, exc_value, exc_traceback)
-            if ai_output:
-                output_parts.append(ai_output)
-        
-        # Always include static friendly message as fallback/complement
-        friendly_message = get_friendly_message(exc_type, exc_value, tb=exc_traceback)
-        
-        # If we have AI/chain output, combine them appropriately
-        if output_parts:
-            full_output = "\n".join(output_parts)
-            # Add a separator before static message if AI provided output
-            full_output += "\n\n" + "=" * 70 + "\n"
-            full_output += "📝 Quick Reference (Static):\n"
-            full_output += friendly_message
-        else:
-            full_output = friendly_message
-        
-        print(full_output, file=sys.stderr)
-        
-        # Log to file if logging is configured
-        if _logger is not None:
-            tb_str = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-            _logger.error(f"Exception occurred:\n{tb_str}\n{full_output}")
-            
-    except Exception as e:
-        # If errfriendly fails, print a warning and ensure the original traceback is shown
-        print(
-            f"\n[errfriendly] Failed to generate friendly message: {e}",
-            file=sys.stderr
-        )
-        # If we didn't already show the traceback, show it now
-        if not _show_original_traceback:
-            traceback.print_exception(exc_type, exc_value, exc_traceback)
+        if codecs.lookup(stream.encoding).name != "utf-8":
+            return None
+        return stream.fileno()
+    except Exception:
+        return None
+
+
+def _stderr_is_live() -> bool:
+    """Check whether output written to the current stderr can end up anywhere.
+    
+    Returns False for a missing or closed stream, or one attached to
+    ``os.devnull``. In-memory streams without a file descriptor count as live.
+    The devnull check is remembered per stream object, so replacing
+    ``sys.stderr`` at any point is picked up on the next call.
+    """
+    stream = sys.stderr
+    if stream is None or getattr(stream, "closed", False):
+        return False
+    probe = _STATE.stderr_probe
+    if probe is not None and probe[0] is stream:
+        return probe[1]
+    
+    try:
+        fd = stream.fileno()
+    except Exception:
+        live = True
+    else:
+        try:
+            live = not os.path.samestat(os.fstat(fd), os.stat(os.devnull))
+        except OSError:
+            live = True
+    _STATE.stderr_probe = (stream, live)
+    return live
+
+
+def _write_stderr(text: str, prefix: str = "") -> None:
+    """
+    Print a message line to stderr in a single write.
+    
+    ``prefix`` (typically the formatted traceback) is emitted in the same
+    write, so output from concurrent failures cannot interleave between
+    the traceback and its explanation. On the interpreter's own stderr the
+    write is a single os.write() of the (memoized) encoded message.
+    """
+    if not _stderr_is_live():
+        return
+    fd = _raw_stderr_fd()
+    if fd is None:
+        sys.stderr.write(prefix + text + "\n")
+        sys.stderr.flush()
+        return
+    
+    # Keep ordering with anything already buffered
+    sys.stderr.flush()
+    payload = _encode_line(text)
+    if prefix:
+        payload = prefix.encode("utf-8", "backslashreplace") + payload
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _report_failure(error: Exception) -> None:
+    """Warn that errfriendly itself failed while handling an exception."""
+    print(
+        f"\n[errfriendly] Failed to generate friendly message: {error}",
+        file=sys.stderr
+    )
+
+
+def _make_hook(show_tb: bool, logger: Optional["logging.Logger"]):
+    """
+    Build an exception hook specialized for the given configuration.
+    
+    The traceback and logging settings only change in install(), so instead
+    of re-reading them on every exception we pick one of four variants
+    with those branches resolved and the logger bound in the closure.
+    
+    Each hook shows the original traceback (if configured) and a friendly
+    explanation, written together in one call; interrupts and clean-exit
+    exceptions (``_BYPASS_EXC``) are handed to ``sys.__excepthook__``
+    untouched. If message generation fails, a warning is printed and the
+    original traceback is always shown.
+    
+    Args:
+        show_tb: Whether to print the standard Python traceback first.
+        logger: Logger to record exceptions to, or None to skip logging.
+    
+    Returns:
+        A function suitable for ``sys.excepthook``.
+    """
+    if logger is not None:
+        from logging import ERROR
+    
+    if show_tb and logger is None:
+        def _hook_tb_nolog(exc_type, exc_value, exc_traceback) -> None:
+            if issubclass(exc_type, _BYPASS_EXC):
+                return sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            # Nothing to log, so skip formatting output nobody can see
+            if not _stderr_is_live():
+                return
+            tb_text = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+            try:
+                full_output = _build_friendly_output(exc_type, exc_value, exc_traceback)
+            except Exception as e:
+                sys.stderr.write(tb_text)
+                _report_failure(e)
+                return
+            try:
+                _write_stderr(full_output, prefix=tb_text)
+            except Exception as e:
+                _report_failure(e)
+        hook = _hook_tb_nolog
+    
+    elif show_tb:
+        def _hook_tb_log(exc_type, exc_value, exc_traceback) -> None:
+            if issubclass(exc_type, _BYPASS_EXC):
+                return sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            # Keep the formatted text so the logger can reuse it
+            tb_text = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+            try:
+                full_output = _build_friendly_output(exc_type, exc_value, exc_traceback)
+            except Exception as e:
+                sys.stderr.write(tb_text)
+                _report_failure(e)
+                return
+            try:
+                _write_stderr(full_output, prefix=tb_text)
+                if logger.isEnabledFor(ERROR):
+                    logger.error(
+                        "Exception occurred:\n%s",
+                        _LazyTraceback(exc_type, exc_value, exc_traceback, full_output, tb_text)
+                    )
+            except Exception as e:
+                _report_failure(e)
+        hook = _hook_tb_log
+    
+    elif logger is None:
+        def _hook_notb_nolog(exc_type, exc_value, exc_traceback) -> None:
+            if issubclass(exc_type, _BYPASS_EXC):
+                return sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            # Nothing to log, so skip formatting output nobody can see
+            if not _stderr_is_live():
+                return
+            try:
+                _write_stderr(_build_friendly_output(exc_type, exc_value, exc_traceback))
+            except Exception as e:
+                _report_failure(e)
+                # We didn't show the traceback yet, show it now
+                traceback.print_exception(exc_type, exc_value, exc_traceback)
+        hook = _hook_notb_nolog
+    
+    else:
+        def _hook_notb_log(exc_type, exc_value, exc_traceback) -> None:
+            if issubclass(exc_type, _BYPASS_EXC):
+                return sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            try:
+                full_output = _build_friendly_output(exc_type, exc_value, exc_traceback)
+                _write_stderr(full_output)
+                if logger.isEnabledFor(ERROR):
+                    logger.error(
+                        "Exception occurred:\n%s",
+                        _LazyTraceback(exc_type, exc_value, exc_traceback, full_output)
+                    )
+            except Exception as e:
+                _report_failure(e)
+                # We didn't show the traceback yet, show it now
+                traceback.print_exception(exc_type, exc_value, exc_traceback)
+        hook = _hook_notb_log
+    
+    return hook
 
 
 def _has_exception_chain(exc_value: BaseException) -> bool:
@@ -221,6 +510,19 @@ def _generate_ai_explanation(
     return None
 
 
+def _close_logger() -> None:
+    """Tear down the logging set up by install(), if any."""
+    if _STATE.log_listener is None:
+        return
+    
+    _STATE.log_finalizer()
+    _STATE.log_listener = None
+    _STATE.log_finalizer = None
+    
+    from .file_logger import close_logger
+    close_logger()
+
+
 def install(
     show_original_traceback: bool = True,
     log_file: Optional[str] = None,
@@ -246,36 +548,41 @@ def install(
         >>> # Now exceptions will show friendly messages
         >>> 1 / 0  # Will show friendly ZeroDivisionError explanation
     """
-    global _original_excepthook, _show_original_traceback, _logger
-    
     # Enable friendly warnings if requested
     if catch_warnings:
         enable_warnings()
     
+    # Already installed with this configuration: nothing to rebuild (and no
+    # log file to reopen)
+    new_cfg = (show_original_traceback, log_file)
+    if new_cfg == _STATE.installed_cfg and is_installed():
+        return
+    
     # Store the original hook only if we haven't already
-    if _original_excepthook is None:
-        _original_excepthook = sys.excepthook
+    if _STATE.original_hook is None:
+        _STATE.original_hook = sys.excepthook
     
-    # Store the configuration
-    _show_original_traceback = show_original_traceback
+    # Tear down any logging set up by a previous install()
+    _close_logger()
     
-    # Set up logging if log_file is provided
+    # Set up logging if log_file is provided. The hook only enqueues the
+    # record; a background listener owns the FileHandler and does the I/O.
+    logger = None
     if log_file is not None:
-        _logger = logging.getLogger("errfriendly")
-        _logger.setLevel(logging.ERROR)
-        # Remove existing handlers to avoid duplicates
-        _logger.handlers.clear()
-        # Create file handler
-        handler = logging.FileHandler(log_file, encoding="utf-8")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s\n%(message)s")
-        )
-        _logger.addHandler(handler)
-    else:
-        _logger = None
-    
-    # Install our custom hook
-    sys.excepthook = _friendly_excepthook
+        from .file_logger import start_file_logging, stop_listener
+        logger, _STATE.log_listener = start_file_logging(log_file)
+        # Run-once closer: called by _close_logger() on uninstall()/reinstall,
+        # otherwise at interpreter exit (_STATE is a module singleton and is
+        # never collected), so records queued for a fatal exception are
+        # written before the daemon listener thread dies
+        _STATE.log_finalizer = weakref.finalize(_STATE, stop_listener, _STATE.log_listener)
+    
+    # Install a hook specialized for this configuration; the settings live
+    # in its closure rather than in module globals. Whether stderr is worth
+    # writing to is checked per exception (it may be replaced later).
+    _STATE.current_hook = _make_hook(show_original_traceback, logger)
+    sys.excepthook = _STATE.current_hook
+    _STATE.installed_cfg = new_cfg
 
 
 def uninstall() -> None:
@@ -291,25 +598,23 @@ def uninstall() -> None:
         >>> # ... use your code ...
         >>> errfriendly.uninstall()  # Back to normal exceptions
     """
-    global _original_excepthook, _logger, _config
+    global _config
     global _context_collector, _ai_explainer, _chain_analyzer
     
     disable_warnings()
     
     # Restore the original hook if we have one saved
-    if _original_excepthook is not None:
-        sys.excepthook = _original_excepthook
-        _original_excepthook = None
+    if _STATE.original_hook is not None:
+        sys.excepthook = _STATE.original_hook
+        _STATE.original_hook = None
     else:
         # No original hook saved, restore the default
         sys.excepthook = sys.__excepthook__
+    _STATE.current_hook = None
+    _STATE.installed_cfg = None
     
     # Clean up logger
-    if _logger is not None:
-        for handler in _logger.handlers:
-            handler.close()
-        _logger.handlers.clear()
-        _logger = None
+    _close_logger()
     
     # Reset AI components
     _context_collector = None
@@ -320,10 +625,13 @@ def uninstall() -> None:
     _config = Config()
 
 
-def is_installed() -> bool:
+def is_installed(_sys=sys) -> bool:
     """
     Check if the friendly exception hook is currently installed.
     
+    The private default argument binds ``sys`` as a fast local; callers
+    should not pass it.
+    
     Returns:
         True if errfriendly is currently handling exceptions, False otherwise.
     
@@ -335,7 +643,141 @@ def is_installed() -> bool:
         >>> errfriendly.is_installed()
         True
     """
-    return sys.excepthook is _friendly_excepthook
+    hook = _STATE.current_hook
+    return hook is not None and _sys.excepthook is hook
+
+
+# =============================================================================
+# asyncio integration
+# =============================================================================
+
+# Exceptions reported by the event loop within this window (seconds) are
+# printed together as one batch
+_ASYNC_BATCH_WINDOW = 0.001
+
+
+class _AsyncExceptionBatcher:
+    """
+    Event loop exception handler that coalesces failures into batches.
+    
+    When several tasks fail close together, the first report schedules a
+    flush after ``_ASYNC_BATCH_WINDOW``; everything queued until then is
+    written to stderr in a single call and logged as a single record.
+    
+    Batching needs the loop to run the scheduled flush, so reports arriving
+    while it is stopped or closed (e.g. a failed task garbage-collected
+    after ``run_until_complete()`` returned) are written immediately.
+    """
+    
+    def __init__(self, show_tb: bool) -> None:
+        self.show_tb = show_tb
+        self.pending: List[Dict[str, Any]] = []
+        self.flush_handle = None
+    
+    def __call__(self, loop, context: Dict[str, Any]) -> None:
+        self.pending.append(context)
+        if loop.is_closed() or not loop.is_running():
+            if self.flush_handle is not None:
+                self.flush_handle.cancel()
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(_ASYNC_BATCH_WINDOW, self.flush)
+    
+    def flush(self) -> None:
+        """Report all queued exception contexts at once."""
+        self.flush_handle = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        
+        parts = []
+        log_parts = []
+        for context in pending:
+            message = context.get("message") or "Unhandled exception in event loop"
+            exc = context.get("exception")
+            if exc is None:
+                parts.append(f"[errfriendly] asyncio: {message}\n")
+                log_parts.append(message)
+                continue
+            
+            exc_type, exc_traceback = type(exc), exc.__traceback__
+            tb_text = "".join(traceback.format_exception(exc_type, exc, exc_traceback))
+            try:
+                friendly = _build_friendly_output(exc_type, exc, exc_traceback)
+                shown_tb = tb_text if self.show_tb else ""
+            except Exception as e:
+                friendly = f"\n[errfriendly] Failed to generate friendly message: {e}"
+                # Never hide the traceback if we have nothing better to show
+                shown_tb = tb_text
+            parts.append(f"{message}\n{shown_tb}{friendly}\n")
+            log_parts.append(f"{message}\n{tb_text}\n{friendly}")
+        
+        sys.stderr.write("".join(parts))
+        sys.stderr.flush()
+        
+        if _STATE.log_listener is not None:
+            import logging
+            from .file_logger import LOGGER_NAME
+            logger = logging.getLogger(LOGGER_NAME)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "%d asyncio exception(s) occurred:\n%s",
+                    len(log_parts), "\n\n".join(log_parts)
+                )
+
+
+def _default_loop():
+    """Get the running event loop; raises RuntimeError outside of one."""
+    import asyncio
+    return asyncio.get_running_loop()
+
+
+def install_async(loop=None, show_original_traceback: bool = True) -> None:
+    """
+    Install friendly reporting for exceptions handled by an asyncio event loop.
+    
+    ``sys.excepthook`` only sees exceptions that reach the top level; failures
+    reported by the event loop itself (for example "Task exception was never
+    retrieved") go through the loop's exception handler instead. This sets
+    that handler so such failures get friendly explanations too, batching
+    reports that arrive within a millisecond of each other.
+    
+    Args:
+        loop: The event loop to configure. Defaults to the running loop;
+            must be given when called outside of one.
+        show_original_traceback: If True (default), include the standard
+            traceback before each friendly message.
+    
+    Example:
+        >>> import asyncio
+        >>> import errfriendly
+        >>> async def main():
+        ...     errfriendly.install_async()
+        ...     ...
+        >>> asyncio.run(main())
+    """
+    if loop is None:
+        loop = _default_loop()
+    
+    loop.set_exception_handler(_AsyncExceptionBatcher(show_original_traceback))
+
+
+def uninstall_async(loop=None) -> None:
+    """
+    Restore the default exception handler of an asyncio event loop.
+    
+    Args:
+        loop: The event loop to reset. Defaults to the running loop;
+            must be given when called outside of one.
+    """
+    if loop is None:
+        loop = _default_loop()
+    
+    handler = loop.get_exception_handler()
+    if isinstance(handler, _AsyncExceptionBatcher):
+        # Report anything still waiting for the batch window
+        handler.flush()
+        loop.set_exception_handler(None)
 
 
 # =============================================================================
@@ -9,20 +9,34 @@ that analyzes the error message and provides contextual advice.
 import re
 import sys
 import difflib
-from typing import Type, Optional, List, Any, Dict, Tuple, Union
+from types import TracebackType
+from typing import Type, Optional, List, Any, Dict, Tuple, Union, Callable, ClassVar
 from collections.abc import MutableMapping
 
 
 # ANSI color codes for terminal output
 class _Colors:
     """ANSI color codes for terminal output."""
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    RED = "\033[91m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    CYAN = "\033[96m"
+    RESET: ClassVar[str] = "\033[0m"
+    BOLD: ClassVar[str] = "\033[1m"
+    RED: ClassVar[str] = "\033[91m"
+    GREEN: ClassVar[str] = "\033[92m"
+    YELLOW: ClassVar[str] = "\033[93m"
+    BLUE: ClassVar[str] = "\033[94m"
+    CYAN: ClassVar[str] = "\033[96m"
+
+
+# Patterns used to pull details out of exception messages (compiled once)
+_NOT_CALLABLE_RE = re.compile(r"'(\w+)'.*not callable")
+_UNSUPPORTED_OPERAND_RE = re.compile(r"unsupported operand type\(s\) for (.+): '(\w+)' and '(\w+)'")
+_CONCATENATE_RE = re.compile(r"can only concatenate (\w+).*to (\w+)")
+_MISSING_ARGUMENT_RE = re.compile(r"missing (\d+) required positional argument")
+_INVALID_INT_LITERAL_RE = re.compile(r"invalid literal for int\(\) with base \d+: ['\"](.+)['\"]")
+_OBJECT_NO_ATTRIBUTE_RE = re.compile(r"'(\w+)' object has no attribute '(\w+)'")
+_NO_ATTRIBUTE_RE = re.compile(r"no attribute '(\w+)'")
+_CANNOT_IMPORT_NAME_RE = re.compile(r"cannot import name '(\w+)'")
+_NO_MODULE_NAMED_RE = re.compile(r"No module named '([^']+)'")
+_NAME_NOT_DEFINED_RE = re.compile(r"name '(\w+)' is not defined")
 
 
 def _use_colors() -> bool:
@@ -33,17 +47,26 @@ def _use_colors() -> bool:
         return False
 
 
+def _is_text_only(exc_type: Type[BaseException]) -> bool:
+    """Check if the friendly message is fully determined by type and message text.
+    
+    See ``_INSTANCE_SENSITIVE`` next to the dispatch table.
+    """
+    return exc_type.__name__ not in _INSTANCE_SENSITIVE
+
+
 def get_friendly_message(
     exc_type: Type[BaseException], 
-    exc_value: BaseException, 
-    tb: Optional["types.TracebackType"] = None
+    exc_value: Union[BaseException, str], 
+    tb: Optional[TracebackType] = None
 ) -> str:
     """
     Get a friendly, human-readable explanation for an exception.
     
     Args:
         exc_type: The type of the exception (e.g., TypeError, ValueError).
-        exc_value: The exception instance containing the error message.
+        exc_value: The exception instance containing the error message, or
+            the message text itself (``str(exc_value)``).
         tb: Optional traceback object for context inspection.
     
     Returns:
@@ -51,41 +74,11 @@ def get_friendly_message(
         for how to fix it.
     """
     exc_name = exc_type.__name__
-    error_message = str(exc_value)
-    
-    # Map exception types to their handler functions
-    handlers = {
-        "TypeError": _explain_type_error,
-        "IndexError": _explain_index_error,
-        "KeyError": _explain_key_error,
-        "ValueError": _explain_value_error,
-        "AttributeError": _explain_attribute_error,
-        "ImportError": _explain_import_error,
-        "ModuleNotFoundError": _explain_module_not_found_error,
-        "ZeroDivisionError": _explain_zero_division_error,
-        "FileNotFoundError": _explain_file_not_found_error,
-        "NameError": _explain_name_error,
-        "SyntaxError": _explain_syntax_error,
-        "RecursionError": _explain_recursion_error,
-        "PermissionError": _explain_permission_error,
-        "StopIteration": _explain_stop_iteration,
-        "OverflowError": _explain_overflow_error,
-        "MemoryError": _explain_memory_error,
-        "UnicodeDecodeError": _explain_unicode_decode_error,
-        "UnicodeEncodeError": _explain_unicode_encode_error,
-        "AssertionError": _explain_assertion_error,
-        "NotImplementedError": _explain_not_implemented_error,
-        "KeyboardInterrupt": _explain_keyboard_interrupt,
-        "TimeoutError": _explain_timeout_error,
-        "ConnectionError": _explain_connection_error,
-    }
-    
-    handler = handlers.get(exc_name, _explain_generic_error)
-    
-    # Check if handler accepts traceback (inspect signature)
-    import inspect
-    sig = inspect.signature(handler)
-    if "tb" in sig.parameters:
+    error_message = exc_value if isinstance(exc_value, str) else str(exc_value)
+    
+    handler = _HANDLERS.get(exc_name, _explain_generic_error)
+    
+    if exc_name in _TB_HANDLERS:
         return handler(exc_type, exc_value, error_message, tb=tb)
     return handler(exc_type, exc_value, error_message)
 
@@ -240,7 +233,7 @@ def _explain_type_error(exc_type: Type[BaseException], exc_value: BaseException,
     
     # Not callable (general)
     if "not callable" in error_message:
-        match = re.search(r"'(\w+)'.*not callable", error_message)
+        match = _NOT_CALLABLE_RE.search(error_message)
         type_name = match.group(1) if match else "object"
         return _format_message(
             f"TypeError: '{type_name}' is not callable",
@@ -256,7 +249,7 @@ def _explain_type_error(exc_type: Type[BaseException], exc_value: BaseException,
     
     # Unsupported operand types
     if "unsupported operand type" in error_message:
-        match = re.search(r"unsupported operand type\(s\) for (.+): '(\w+)' and '(\w+)'", error_message)
+        match = _UNSUPPORTED_OPERAND_RE.search(error_message)
         if match:
             operator, type1, type2 = match.groups()
             return _format_message(
@@ -273,7 +266,7 @@ def _explain_type_error(exc_type: Type[BaseException], exc_value: BaseException,
     
     # Can only concatenate
     if "can only concatenate" in error_message:
-        match = re.search(r"can only concatenate (\w+).*to (\w+)", error_message)
+        match = _CONCATENATE_RE.search(error_message)
         if match:
             type1, type2 = match.groups()
             return _format_message(
@@ -290,7 +283,7 @@ def _explain_type_error(exc_type: Type[BaseException], exc_value: BaseException,
     
     # Missing positional argument
     if "missing" in error_message and "required positional argument" in error_message:
-        match = re.search(r"missing (\d+) required positional argument", error_message)
+        match = _MISSING_ARGUMENT_RE.search(error_message)
         count = match.group(1) if match else "some"
         return _format_message(
             "TypeError: Missing required argument(s)",
@@ -415,7 +408,7 @@ def _explain_key_error(
             locals_dict = frame.f_locals
             
             # Find candidate dictionaries (variables that are dicts)
-            candidates = []
+            candidates: List[Any] = []
             for name, val in locals_dict.items():
                 if isinstance(val, (dict, MutableMapping)) and len(val) > 0:
                     candidates.extend(val.keys())
@@ -463,7 +456,7 @@ def _explain_value_error(exc_type: Type[BaseException], exc_value: BaseException
     
     # Invalid literal for int() with base 10
     if "invalid literal for int()" in error_message:
-        match = re.search(r"invalid literal for int\(\) with base \d+: ['\"](.+)['\"]", error_message)
+        match = _INVALID_INT_LITERAL_RE.search(error_message)
         bad_value = match.group(1) if match else "your value"
         return _format_message(
             "ValueError: Can't convert string to integer",
@@ -552,7 +545,7 @@ def _explain_attribute_error(exc_type: Type[BaseException], exc_value: BaseExcep
     """Handle AttributeError exceptions."""
     
     # Extract type and attribute from error message
-    match = re.search(r"'(\w+)' object has no attribute '(\w+)'", error_message)
+    match = _OBJECT_NO_ATTRIBUTE_RE.search(error_message)
     if match:
         obj_type, attr_name = match.groups()
         return _format_message(
@@ -570,7 +563,7 @@ def _explain_attribute_error(exc_type: Type[BaseException], exc_value: BaseExcep
     
     # NoneType specific
     if "'NoneType' object has no attribute" in error_message:
-        attr_match = re.search(r"no attribute '(\w+)'", error_message)
+        attr_match = _NO_ATTRIBUTE_RE.search(error_message)
         attr = attr_match.group(1) if attr_match else "method/attribute"
         return _format_message(
             f"AttributeError: None has no attribute '{attr}'",
@@ -602,7 +595,7 @@ def _explain_import_error(exc_type: Type[BaseException], exc_value: BaseExceptio
     
     # Cannot import name
     if "cannot import name" in error_message:
-        match = re.search(r"cannot import name '(\w+)'", error_message)
+        match = _CANNOT_IMPORT_NAME_RE.search(error_message)
         name = match.group(1) if match else "the item"
         return _format_message(
             f"ImportError: Cannot import '{name}'",
@@ -633,7 +626,7 @@ def _explain_import_error(exc_type: Type[BaseException], exc_value: BaseExceptio
 def _explain_module_not_found_error(exc_type: Type[BaseException], exc_value: BaseException, error_message: str) -> str:
     """Handle ModuleNotFoundError exceptions."""
     
-    match = re.search(r"No module named '([^']+)'", error_message)
+    match = _NO_MODULE_NAMED_RE.search(error_message)
     module_name = match.group(1) if match else "the module"
     
     return _format_message(
@@ -703,7 +696,7 @@ def _explain_file_not_found_error(exc_type: Type[BaseException], exc_value: Base
 def _explain_name_error(exc_type: Type[BaseException], exc_value: BaseException, error_message: str) -> str:
     """Handle NameError exceptions."""
     
-    match = re.search(r"name '(\w+)' is not defined", error_message)
+    match = _NAME_NOT_DEFINED_RE.search(error_message)
     name = match.group(1) if match else "the variable"
     
     return _format_message(
@@ -961,3 +954,49 @@ def _explain_generic_error(exc_type: Type[BaseException], exc_value: BaseExcepti
         ]
     )
 
+
+# =============================================================================
+# Dispatch table (built once at import)
+# =============================================================================
+
+# Map exception type names to their handler functions. A handler that looks
+# at anything besides the message text (attributes of ``exc_value`` or the
+# traceback) must be listed in _ATTR_HANDLERS or _TB_HANDLERS below, or
+# callers caching by message text (see _is_text_only) will serve stale output.
+_HANDLERS: Dict[str, Callable[..., str]] = {
+    "TypeError": _explain_type_error,
+    "IndexError": _explain_index_error,
+    "KeyError": _explain_key_error,
+    "ValueError": _explain_value_error,
+    "AttributeError": _explain_attribute_error,
+    "ImportError": _explain_import_error,
+    "ModuleNotFoundError": _explain_module_not_found_error,
+    "ZeroDivisionError": _explain_zero_division_error,
+    "FileNotFoundError": _explain_file_not_found_error,
+    "NameError": _explain_name_error,
+    "SyntaxError": _explain_syntax_error,
+    "RecursionError": _explain_recursion_error,
+    "PermissionError": _explain_permission_error,
+    "StopIteration": _explain_stop_iteration,
+    "OverflowError": _explain_overflow_error,
+    "MemoryError": _explain_memory_error,
+    "UnicodeDecodeError": _explain_unicode_decode_error,
+    "UnicodeEncodeError": _explain_unicode_encode_error,
+    "AssertionError": _explain_assertion_error,
+    "NotImplementedError": _explain_not_implemented_error,
+    "KeyboardInterrupt": _explain_keyboard_interrupt,
+    "TimeoutError": _explain_timeout_error,
+    "ConnectionError": _explain_connection_error,
+}
+
+# Handlers that accept the traceback for context inspection (a ``tb``
+# parameter). Listed explicitly: inspect.signature() cannot read compiled
+# functions on every mypyc version.
+_TB_HANDLERS = frozenset({"KeyError"})
+
+# Handlers that read attributes of ``exc_value`` (e.g. ``filename``)
+_ATTR_HANDLERS = frozenset({"FileNotFoundError", "PermissionError"})
+
+# Exception types whose explanation depends on more than the type and the
+# message text
+_INSTANCE_SENSITIVE = _TB_HANDLERS | _ATTR_HANDLERS
@@ -0,0 +1,16 @@
+"""
+Shared pytest configuration for the errfriendly test suite.
+
+The suite is small enough that plugin start-up can cost more than the tests
+themselves. For a quick parallel run (needs pytest-xdist)::
+
+    pytest -p no:cacheprovider -n auto tests/
+
+Add ``--dist loadgroup`` to keep each ``xdist_group`` on a single worker.
+"""
+
+def pytest_configure(config):
+    # Registered here so the marker is known even without pytest-xdist.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on the same xdist worker"
+    )
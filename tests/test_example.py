@@ -2,209 +2,198 @@
 Test suite for errfriendly package.
 
 These tests verify that the friendly error messages are displayed correctly
-when exceptions occur in scripts using errfriendly.
+when exceptions occur in scripts using errfriendly. Message checks run the
+hook in-process; behaviour that depends on a fresh interpreter (hook
+installation, logging at exit) runs in a subprocess.
 """
 
+import contextlib
+import io
 import subprocess
 import sys
 import tempfile
 import os
-import textwrap
 
 import pytest
 
+import errfriendly
+from errfriendly.messages import get_friendly_message
 
+
+@pytest.fixture(scope="module")
+def installed_handler():
+    """Install errfriendly once for the module and yield the active hook."""
+    errfriendly.install()
+    yield sys.excepthook
+    errfriendly.uninstall()
+
+
+# (id, snippet, any_of, all_of): the hook output must contain at least one
+# of any_of (if given), every one of all_of, and the banner.
+CASES = [
+    ("none_subscript", "x = None\nprint(x[0])\n",
+     frozenset({"NoneType", "None"}), frozenset({"How to fix it"})),
+    ("not_callable", "x = 42\nx()\n",
+     frozenset({"callable"}), frozenset({"How to fix it"})),
+    ("index_error", "my_list = [1, 2, 3]\nprint(my_list[10])\n",
+     frozenset({"index", "Index"}), frozenset({"How to fix it"})),
+    ("key_error", "my_dict = {'a': 1}\nprint(my_dict['nonexistent'])\n",
+     frozenset({"Key", "key"}), frozenset({"How to fix it"})),
+    ("int_conversion", 'x = int("not_a_number")\n',
+     frozenset(), frozenset({"How to fix it"})),
+    ("attribute_error", 'x = "hello"\nx.nonexistent_method()\n',
+     frozenset({"attribute", "Attribute"}), frozenset({"How to fix it"})),
+    ("zero_division", "result = 10 / 0\n",
+     frozenset({"zero", "Zero"}), frozenset({"How to fix it"})),
+    ("module_not_found", "import this_module_definitely_does_not_exist_12345\n",
+     frozenset({"module", "Module"}), frozenset({"How to fix it"})),
+    ("file_not_found", "with open('/nonexistent/path/to/file.txt') as f:\n    pass\n",
+     frozenset(), frozenset({"How to fix it"})),
+    ("name_error", "print(undefined_variable)\n",
+     frozenset(), frozenset({"How to fix it"})),
+]
+
+_BANNER = "FRIENDLY ERROR EXPLANATION"
+
+
+@pytest.mark.xdist_group("errfriendly")
+@pytest.mark.usefixtures("installed_handler")
 class TestErrorMessages:
     """Test that friendly error messages are displayed for various exception types."""
     
-    def run_script(self, script_content: str) -> tuple[str, str, int]:
+    def run_code(self, code: str) -> str:
         """
-        Run a Python script and capture its output.
+        Run code in-process and pass the exception it raises to the hook.
         
         Args:
-            script_content: The Python code to execute.
+            code: The Python code to execute. It is expected to raise.
             
         Returns:
-            Tuple of (stdout, stderr, return_code)
+            Everything the hook wrote to stderr.
         """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script_content)
-            f.flush()
-            temp_path = f.name
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return result.stdout, result.stderr, result.returncode
-        finally:
-            os.unlink(temp_path)
-    
-    def test_type_error_none_subscript(self):
-        """Test that TypeError for NoneType subscript shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            x = None
-            print(x[0])
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "NoneType" in stderr or "None" in stderr
-        assert "How to fix it" in stderr
-    
-    def test_type_error_not_callable(self):
-        """Test that TypeError for not callable shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            x = 42
-            x()
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "callable" in stderr.lower()
-        assert "How to fix it" in stderr
-    
-    def test_index_error(self):
-        """Test that IndexError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            my_list = [1, 2, 3]
-            print(my_list[10])
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "index" in stderr.lower() or "Index" in stderr
-        assert "How to fix it" in stderr
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            try:
+                exec(compile(code, "<test>", "exec"), {})
+            except BaseException:
+                sys.excepthook(*sys.exc_info())
+            else:
+                pytest.fail("code did not raise")
+        return stderr.getvalue()
     
-    def test_key_error(self):
-        """Test that KeyError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            my_dict = {'a': 1}
-            print(my_dict['nonexistent'])
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "Key" in stderr or "key" in stderr
-        assert "How to fix it" in stderr
-    
-    def test_value_error_int_conversion(self):
-        """Test that ValueError for invalid int conversion shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            x = int("not_a_number")
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "How to fix it" in stderr
-    
-    def test_attribute_error(self):
-        """Test that AttributeError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            x = "hello"
-            x.nonexistent_method()
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "attribute" in stderr.lower() or "Attribute" in stderr
-        assert "How to fix it" in stderr
-    
-    def test_zero_division_error(self):
-        """Test that ZeroDivisionError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            result = 10 / 0
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "zero" in stderr.lower() or "Zero" in stderr
-        assert "How to fix it" in stderr
-    
-    def test_module_not_found_error(self):
-        """Test that ModuleNotFoundError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            import this_module_definitely_does_not_exist_12345
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "module" in stderr.lower() or "Module" in stderr
-        assert "How to fix it" in stderr
+    @pytest.mark.parametrize("name,snippet,any_of,all_of", CASES, ids=[c[0] for c in CASES])
+    def test_friendly_message(self, name, snippet, any_of, all_of):
+        """Test that each exception type gets a friendly message."""
+        stderr = self.run_code(snippet)
+        # Each needle is checked on its own, so one that is a prefix of
+        # another (e.g. "None" / "NoneType") is still seen
+        found = {s for s in any_of | all_of | {_BANNER} if s in stderr}
+        
+        assert all_of | {_BANNER} <= found
+        assert not any_of or any_of & found
+
+
+# Scenarios that need a real (non-pytest) interpreter: each runs as a
+# genuine script via run_script(), seeing the interpreter's own stderr and
+# exit path.
+SCRIPT_INSTALL_AND_UNINSTALL = """\
+import sys
+import errfriendly
+
+# Store original hook
+original = sys.excepthook
+
+# Install errfriendly
+errfriendly.install()
+assert sys.excepthook is not original, "Hook should be changed after install"
+
+# Check is_installed
+from errfriendly.handler import is_installed
+assert is_installed(), "is_installed should return True"
+
+# Uninstall
+errfriendly.uninstall()
+
+# Check is_installed after uninstall
+assert not is_installed(), "is_installed should return False after uninstall"
+
+print("SUCCESS")
+"""
+
+SCRIPT_HIDE_ORIGINAL_TRACEBACK = """\
+import errfriendly
+errfriendly.install(show_original_traceback=False)
+
+1 / 0
+"""
+
+SCRIPT_SHOW_ORIGINAL_TRACEBACK = """\
+import errfriendly
+errfriendly.install(show_original_traceback=True)
+
+1 / 0
+"""
+
+SCRIPT_LOGGING_TO_FILE = """\
+import errfriendly
+import tempfile
+import os
+
+# Create a temporary log file
+log_path = os.path.join(tempfile.gettempdir(), 'errfriendly_test.log')
+
+errfriendly.install(log_file=log_path)
+
+# Trigger an exception
+1 / 0
+"""
+
+SCRIPT_GRACEFUL_FAILURE = """\
+import errfriendly
+from errfriendly import handler
+
+# Monkey-patch at the handler module level where it's actually used
+def broken_get(*args, **kwargs):
+    raise RuntimeError("Simulated internal failure")
+handler.get_friendly_message = broken_get
+
+errfriendly.install()
+
+# Trigger an exception
+1 / 0
+"""
+
+_ERRFRIENDLY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(errfriendly.__file__)))
+
+
+def run_script(script: str) -> dict:
+    """
+    Run a script in a fresh interpreter and let its exception escape.
     
-    def test_file_not_found_error(self):
-        """Test that FileNotFoundError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            with open('/nonexistent/path/to/file.txt') as f:
-                pass
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "How to fix it" in stderr
+    Nothing replaces sys.stderr or calls the hook by hand, so the hook
+    writes straight to fd 2 (UTF-8 mode makes it eligible) and logging is
+    flushed by interpreter shutdown. The child runs isolated (-I), which
+    ignores PYTHONPATH, so the directory errfriendly was imported from here
+    is put on sys.path by a one-line prelude instead.
     
-    def test_name_error(self):
-        """Test that NameError shows friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install()
-            
-            print(undefined_variable)
-        """)
-        
-        stdout, stderr, code = self.run_script(script)
-        
-        assert code != 0
-        assert "FRIENDLY ERROR EXPLANATION" in stderr
-        assert "How to fix it" in stderr
+    Returns:
+        A dict with the script's stdout, stderr and rc.
+    """
+    prelude = f"import sys; sys.path.insert(0, {_ERRFRIENDLY_PATH!r})\n"
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        proc = subprocess.run(
+            [sys.executable, "-I", "-X", "utf8", "-c", prelude + script],
+            stdout=out.fileno(),
+            stderr=err.fileno(),
+            timeout=30
+        )
+        out.seek(0)
+        err.seek(0)
+        return {
+            "stdout": out.read().decode("utf-8", "replace"),
+            "stderr": err.read().decode("utf-8", "replace"),
+            "rc": proc.returncode,
+        }
 
 
 class TestInstallUninstall:
@@ -212,96 +201,32 @@ class TestInstallUninstall:
     
     def test_install_and_uninstall(self):
         """Test that install and uninstall work correctly."""
-        script = textwrap.dedent("""
-            import sys
-            import errfriendly
-            
-            # Store original hook
-            original = sys.excepthook
-            
-            # Install errfriendly
-            errfriendly.install()
-            assert sys.excepthook is not original, "Hook should be changed after install"
-            
-            # Check is_installed
-            from errfriendly.handler import is_installed
-            assert is_installed(), "is_installed should return True"
-            
-            # Uninstall
-            errfriendly.uninstall()
-            
-            # Check is_installed after uninstall
-            assert not is_installed(), "is_installed should return False after uninstall"
-            
-            print("SUCCESS")
-        """)
-        
-        result = subprocess.run(
-            [sys.executable, "-c", script],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = run_script(SCRIPT_INSTALL_AND_UNINSTALL)
         
-        assert result.returncode == 0, f"Script failed: {result.stderr}"
-        assert "SUCCESS" in result.stdout
+        assert result["rc"] == 0, f"Script failed: {result['stderr']}"
+        assert "SUCCESS" in result["stdout"]
     
     def test_hide_original_traceback(self):
         """Test that show_original_traceback=False hides the traceback."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install(show_original_traceback=False)
-            
-            1 / 0
-        """)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            f.flush()
-            temp_path = f.name
+        result = run_script(SCRIPT_HIDE_ORIGINAL_TRACEBACK)
         
-        try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Should NOT contain "Traceback" since we hid it
-            assert "Traceback (most recent call last)" not in result.stderr
-            # But SHOULD contain friendly message
-            assert "FRIENDLY ERROR EXPLANATION" in result.stderr
-        finally:
-            os.unlink(temp_path)
+        # Should NOT contain "Traceback" since we hid it
+        assert "Traceback (most recent call last)" not in result["stderr"]
+        # But SHOULD contain friendly message
+        assert "FRIENDLY ERROR EXPLANATION" in result["stderr"]
     
     def test_show_original_traceback(self):
         """Test that show_original_traceback=True shows both traceback and friendly message."""
-        script = textwrap.dedent("""
-            import errfriendly
-            errfriendly.install(show_original_traceback=True)
-            
-            1 / 0
-        """)
+        result = run_script(SCRIPT_SHOW_ORIGINAL_TRACEBACK)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            f.flush()
-            temp_path = f.name
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Should contain both
-            assert "Traceback (most recent call last)" in result.stderr
-            assert "FRIENDLY ERROR EXPLANATION" in result.stderr
-        finally:
-            os.unlink(temp_path)
+        # Should contain both
+        assert "Traceback (most recent call last)" in result["stderr"]
+        assert "FRIENDLY ERROR EXPLANATION" in result["stderr"]
+
+
+def _msg(t, s):
+    """Friendly message for a fresh ``t(s)`` exception."""
+    return get_friendly_message(t, t(s))
 
 
 class TestMessageModule:
@@ -309,52 +234,46 @@ class TestMessageModule:
     
     def test_get_friendly_message_returns_string(self):
         """Test that get_friendly_message returns a non-empty string."""
-        from errfriendly.messages import get_friendly_message
-        
         # Test with various exception types
         exceptions = [
-            (TypeError, TypeError("test")),
-            (ValueError, ValueError("test")),
-            (KeyError, KeyError("test")),
-            (IndexError, IndexError("test")),
-            (ZeroDivisionError, ZeroDivisionError("test")),
+            (TypeError, "test"),
+            (ValueError, "test"),
+            (KeyError, "test"),
+            (IndexError, "test"),
+            (ZeroDivisionError, "test"),
         ]
         
-        for exc_type, exc_value in exceptions:
-            message = get_friendly_message(exc_type, exc_value)
+        for exc_type, text in exceptions:
+            message = _msg(exc_type, text)
             assert isinstance(message, str)
             assert len(message) > 0
             assert "FRIENDLY ERROR EXPLANATION" in message
     
     def test_messages_contain_fix_suggestions(self):
         """Test that all messages contain fix suggestions."""
-        from errfriendly.messages import get_friendly_message
-        
         exceptions = [
-            (TypeError, TypeError("'NoneType' object is not subscriptable")),
-            (ValueError, ValueError("invalid literal for int() with base 10: 'abc'")),
-            (KeyError, KeyError("missing_key")),
-            (IndexError, IndexError("list index out of range")),
-            (AttributeError, AttributeError("'str' object has no attribute 'foo'")),
+            (TypeError, "'NoneType' object is not subscriptable"),
+            (ValueError, "invalid literal for int() with base 10: 'abc'"),
+            (KeyError, "missing_key"),
+            (IndexError, "list index out of range"),
+            (AttributeError, "'str' object has no attribute 'foo'"),
         ]
         
-        for exc_type, exc_value in exceptions:
-            message = get_friendly_message(exc_type, exc_value)
+        for exc_type, text in exceptions:
+            message = _msg(exc_type, text)
             assert "How to fix it" in message
     
     def test_new_exception_handlers(self):
         """Test the new exception handlers added in v0.2.0."""
-        from errfriendly.messages import get_friendly_message
-        
         exceptions = [
-            (AssertionError, AssertionError("expected 1 but got 2")),
-            (NotImplementedError, NotImplementedError("this feature is not available")),
-            (TimeoutError, TimeoutError("connection timed out")),
-            (ConnectionError, ConnectionError("refused")),
+            (AssertionError, "expected 1 but got 2"),
+            (NotImplementedError, "this feature is not available"),
+            (TimeoutError, "connection timed out"),
+            (ConnectionError, "refused"),
         ]
         
-        for exc_type, exc_value in exceptions:
-            message = get_friendly_message(exc_type, exc_value)
+        for exc_type, text in exceptions:
+            message = _msg(exc_type, text)
             assert isinstance(message, str)
             assert len(message) > 0
             assert "FRIENDLY ERROR EXPLANATION" in message
@@ -366,34 +285,12 @@ class TestLogging:
     
     def test_logging_to_file(self):
         """Test that exceptions are logged to a file when configured."""
-        script = textwrap.dedent("""
-            import errfriendly
-            import tempfile
-            import os
-            
-            # Create a temporary log file
-            log_path = os.path.join(tempfile.gettempdir(), 'errfriendly_test.log')
-            
-            errfriendly.install(log_file=log_path)
-            
-            # Trigger an exception
-            1 / 0
-        """)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            f.flush()
-            temp_path = f.name
-        
         log_path = os.path.join(tempfile.gettempdir(), 'errfriendly_test.log')
         
         try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # The record is queued by the hook and only written when the
+            # interpreter exits, so this must be a real script run
+            assert run_script(SCRIPT_LOGGING_TO_FILE)["rc"] != 0
             
             # Check log file was created and contains exception info
             assert os.path.exists(log_path), "Log file should be created"
@@ -402,7 +299,6 @@ class TestLogging:
             assert "ZeroDivisionError" in log_content
             assert "FRIENDLY ERROR EXPLANATION" in log_content
         finally:
-            os.unlink(temp_path)
             if os.path.exists(log_path):
                 os.unlink(log_path)
 
@@ -414,39 +310,9 @@ class TestRobustness:
         """Test that errfriendly fails gracefully if message generation fails."""
         # This tests that if get_friendly_message raises an exception,
         # the original traceback is still shown
-        script = textwrap.dedent("""
-            import errfriendly
-            from errfriendly import handler
-            
-            # Monkey-patch at the handler module level where it's actually used
-            def broken_get(*args, **kwargs):
-                raise RuntimeError("Simulated internal failure")
-            handler.get_friendly_message = broken_get
-            
-            errfriendly.install()
-            
-            # Trigger an exception
-            1 / 0
-        """)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            f.flush()
-            temp_path = f.name
+        result = run_script(SCRIPT_GRACEFUL_FAILURE)
         
-        try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Should contain the warning about errfriendly failing
-            assert "[errfriendly] Failed to generate friendly message" in result.stderr
-            # Should still contain the original traceback
-            assert "ZeroDivisionError" in result.stderr
-        finally:
-            os.unlink(temp_path)
-
-
+        # Should contain the warning about errfriendly failing
+        assert "[errfriendly] Failed to generate friendly message" in result["stderr"]
+        # Should still contain the original traceback
+        assert "ZeroDivisionError" in result["stderr"]
@@ -378,6 +378,105 @@ class TestAPIFunctions:
         errfriendly.uninstall()
         assert errfriendly.is_installed() is False
     
+    def test_hook_specialized_per_config(self):
+        """Test that install() picks a hook variant matching the configuration."""
+        errfriendly.install(show_original_traceback=False)
+        assert sys.excepthook.__name__ == "_hook_notb_nolog"
+        assert errfriendly.is_installed() is True
+        
+        errfriendly.install(show_original_traceback=True)
+        assert sys.excepthook.__name__ == "_hook_tb_nolog"
+        assert errfriendly.is_installed() is True
+    
+    def test_repeated_install_is_idempotent(self):
+        """Test that install() with the same arguments keeps the existing hook."""
+        errfriendly.install()
+        hook = sys.excepthook
+        errfriendly.install()
+        assert sys.excepthook is hook
+        
+        errfriendly.install(show_original_traceback=False)
+        assert sys.excepthook is not hook
+    
+    def test_install_leaves_linecache_alone(self):
+        """Test that install() does not replace linecache.getline (checkcache must keep working)."""
+        import linecache
+        original = linecache.getline
+        
+        errfriendly.install()
+        assert linecache.getline is original
+        errfriendly.uninstall()
+    
+    def test_raw_stderr_fd_not_used_on_windows(self, monkeypatch):
+        """Test that stderr bytes are never written to fd 2 directly on Windows."""
+        from errfriendly.handler import _raw_stderr_fd
+        
+        monkeypatch.setattr(sys, "stderr", sys.__stderr__)
+        monkeypatch.setattr(sys, "platform", "win32")
+        assert _raw_stderr_fd() is None
+    
+    def test_devnull_stderr_not_live(self):
+        """Test that stderr redirected to os.devnull is detected as discarded."""
+        import io
+        import os
+        from errfriendly.handler import _stderr_is_live
+        
+        with open(os.devnull, "w") as devnull:
+            with patch.object(sys, "stderr", devnull):
+                assert _stderr_is_live() is False
+        with patch.object(sys, "stderr", io.StringIO()):
+            assert _stderr_is_live() is True
+    
+    def test_stderr_replaced_after_install_is_written(self):
+        """Test that a devnull stderr at install() does not silence a later stderr."""
+        import io
+        import os
+        
+        with open(os.devnull, "w") as devnull:
+            with patch.object(sys, "stderr", devnull):
+                errfriendly.install()
+        
+        stderr = io.StringIO()
+        with patch.object(sys, "stderr", stderr):
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                sys.excepthook(*sys.exc_info())
+        
+        assert "Traceback (most recent call last)" in stderr.getvalue()
+        assert "FRIENDLY ERROR EXPLANATION" in stderr.getvalue()
+    
+    def test_failing_stderr_write_does_not_escape_hook(self):
+        """Test that an error while writing the report is reported, not raised."""
+        import io
+        
+        class FlakyStream(io.StringIO):
+            """A stream whose first write fails."""
+            failed = False
+            
+            def write(self, text):
+                if not self.failed:
+                    self.failed = True
+                    raise OSError("disk full")
+                return super().write(text)
+        
+        errfriendly.install()
+        stderr = FlakyStream()
+        with patch.object(sys, "stderr", stderr):
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                sys.excepthook(*sys.exc_info())
+        
+        assert "[errfriendly] Failed to generate friendly message: disk full" in stderr.getvalue()
+    
+    def test_keyboard_interrupt_bypasses_friendly_message(self):
+        """Test that KeyboardInterrupt goes straight to the default hook."""
+        errfriendly.install()
+        with patch.object(sys, "__excepthook__") as default_hook:
+            sys.excepthook(KeyboardInterrupt, KeyboardInterrupt(), None)
+        default_hook.assert_called_once()
+    
     def test_enable_ai_local(self):
         """Test enabling local AI."""
         errfriendly.install()
@@ -474,3 +573,147 @@ class TestBackwardCompatibility:
         """Test install with show_original_traceback=False."""
         errfriendly.install(show_original_traceback=False)
         assert errfriendly.is_installed()
+
+
+class TestMessageCache:
+    """Test memoization of static friendly messages."""
+    
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        errfriendly.clear_message_cache()
+    
+    def test_repeated_exception_hits_cache(self):
+        """Test that identical type/message pairs reuse the rendered message."""
+        from errfriendly.handler import _get_friendly_message, _get_friendly_message_cached
+        
+        first = _get_friendly_message(ValueError, ValueError("bad"), None)
+        second = _get_friendly_message(ValueError, ValueError("bad"), None)
+        
+        assert first == second
+        assert _get_friendly_message_cached.cache_info().hits == 1
+    
+    def test_instance_sensitive_exception_not_cached(self):
+        """Test that KeyError (which inspects the traceback) bypasses the cache."""
+        from errfriendly.handler import _get_friendly_message, _get_friendly_message_cached
+        
+        _get_friendly_message(KeyError, KeyError("missing"), None)
+        
+        assert _get_friendly_message_cached.cache_info().currsize == 0
+    
+    def test_tb_handlers_match_signatures(self):
+        """Test that _TB_HANDLERS lists exactly the handlers taking a ``tb`` argument."""
+        import inspect
+        from errfriendly.messages import _HANDLERS, _TB_HANDLERS
+        
+        takes_tb = {
+            name for name, handler in _HANDLERS.items()
+            if "tb" in inspect.signature(handler).parameters
+        }
+        assert _TB_HANDLERS == takes_tb
+    
+    def test_text_only_handlers_ignore_exception_attributes(self):
+        """Test that handlers treated as cacheable by text never read exc_value attributes."""
+        import inspect
+        from errfriendly.messages import _HANDLERS, _INSTANCE_SENSITIVE
+        
+        for name, handler in _HANDLERS.items():
+            if name in _INSTANCE_SENSITIVE:
+                continue
+            source = inspect.getsource(handler)
+            assert "exc_value." not in source, name
+            assert "getattr(exc_value" not in source, name
+    
+    def test_message_string_accepted(self):
+        """Test that get_friendly_message accepts the message text directly."""
+        from errfriendly import get_friendly_message
+        
+        assert get_friendly_message(ZeroDivisionError, "division by zero") == \
+            get_friendly_message(ZeroDivisionError, ZeroDivisionError("division by zero"))
+
+
+class TestAsyncIntegration:
+    """Test friendly reporting of event loop exceptions."""
+    
+    @staticmethod
+    def _orphan_failed_task(loop):
+        """Run a task that fails and return it with its exception unretrieved."""
+        import asyncio
+        
+        async def boom():
+            raise ValueError("orphaned failure")
+        
+        async def main():
+            task = loop.create_task(boom())
+            await asyncio.sleep(0.01)
+            return task
+        
+        return loop.run_until_complete(main())
+    
+    def test_exceptions_reported_in_batch(self, capsys):
+        """Test that failures reported together are flushed as one batch."""
+        import asyncio
+        
+        async def main():
+            for message in ("first failure", "second failure"):
+                loop.call_exception_handler({
+                    "message": "Task exception was never retrieved",
+                    "exception": ValueError(message),
+                })
+            # Both reports are still waiting for the batch window
+            assert capsys.readouterr().err == ""
+            await asyncio.sleep(0.01)
+        
+        loop = asyncio.new_event_loop()
+        try:
+            errfriendly.install_async(loop)
+            loop.run_until_complete(main())
+            errfriendly.uninstall_async(loop)
+            assert loop.get_exception_handler() is None
+        finally:
+            loop.close()
+        
+        stderr = capsys.readouterr().err
+        assert stderr.count("FRIENDLY ERROR EXPLANATION") == 2
+        assert "first failure" in stderr
+        assert "second failure" in stderr
+    
+    def test_report_after_loop_stopped_is_immediate(self, capsys):
+        """Test that a failure reported while the loop is not running is not lost."""
+        import asyncio
+        import gc
+        
+        loop = asyncio.new_event_loop()
+        try:
+            errfriendly.install_async(loop)
+            task = self._orphan_failed_task(loop)
+            del task
+            gc.collect()
+            
+            stderr = capsys.readouterr().err
+            assert "Task exception was never retrieved" in stderr
+            assert "orphaned failure" in stderr
+            assert "FRIENDLY ERROR EXPLANATION" in stderr
+        finally:
+            loop.close()
+    
+    def test_report_after_loop_closed_is_immediate(self, capsys, caplog):
+        """Test that a failure reported after loop.close() does not raise in the handler."""
+        import asyncio
+        import gc
+        
+        loop = asyncio.new_event_loop()
+        errfriendly.install_async(loop)
+        task = self._orphan_failed_task(loop)
+        loop.close()
+        del task
+        gc.collect()
+        
+        stderr = capsys.readouterr().err
+        assert "orphaned failure" in stderr
+        assert "FRIENDLY ERROR EXPLANATION" in stderr
+        assert "Unhandled error in exception handler" not in stderr + caplog.text
+    
+    def test_default_loop_requires_running_loop(self):
+        """Test that install_async() without a loop needs a running one."""
+        with pytest.raises(RuntimeError):
+            errfriendly.install_async()